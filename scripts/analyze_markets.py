@@ -1,4 +1,11 @@
 import asyncio
+import logging
+
+try:
+    import uvloop
+except ImportError:  # optional, not available on Windows
+    uvloop = None
+
 from src.data.polymarket_client import PolymarketClient
 from src.analysis.market_analyzer import MarketAnalyzer
 from src.utils.logger import setup_logger
@@ -15,13 +22,18 @@ async def main():
         analyzer = MarketAnalyzer()
         results = await analyzer.analyze_markets(markets)
         
-        logger.info(f"Analysis complete:")
-        logger.info(f"- Total markets analyzed: {results.total_markets}")
-        logger.info(f"- Relationships found: {len(results.relationships)}")
-        logger.info(f"- Arbitrage opportunities: {sum(1 for r in results.relationships if r.potential_arbitrage)}")
+        # The summary walks every relationship, so skip building it when INFO is filtered out
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Analysis complete:")
+            logger.info(f"- Total markets analyzed: {results.total_markets}")
+            logger.info(f"- Relationships found: {len(results.relationships)}")
+            logger.info(f"- Arbitrage opportunities: {sum(1 for r in results.relationships if r['potential_arbitrage'])}")
         
     except Exception as e:
         logger.error(f"Analysis failed: {str(e)}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -1,9 +1,29 @@
 # src/analysis/arbitrage_detector.py
 
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
 from decimal import Decimal
-from src.data.models import Market
+import numpy as np
+from src.utils.logger import setup_logger
+
+if TYPE_CHECKING:
+    from src.data.models import Market
+
+logger = setup_logger(__name__)
+
+MIN_PROFIT = 0.02  # 2% minimum profit
+TXN_FEE = 0.02  # 2% per trade
+
+# Slack for the pre-screen so rounding never rejects a pair the checks would accept
+_SCREEN_EPS = 1e-9
+# Rows of the pair matrix screened per block, bounding temporaries to _SCREEN_BLOCK_ROWS x N
+_SCREEN_BLOCK_ROWS = 256
+
+def _to_report(value: float) -> Decimal:
+    """Convert a float result to Decimal for reporting, rounding away float noise"""
+    return Decimal(repr(round(value, 6)))
 
 @dataclass
 class ArbitrageOpportunity:
@@ -17,57 +37,75 @@ class ArbitrageOpportunity:
 
 class ArbitrageDetector:
     def __init__(self):
-        self.min_profit_threshold = Decimal('0.02')  # 2% minimum profit
-        self.transaction_fee = Decimal('0.02')  # 2% per trade
+        self._capital = 100.0  # $100 position size
+        self._min_profit_threshold = MIN_PROFIT
+        self._transaction_fee = TXN_FEE
+        self._update_costs()
+
+    @property
+    def min_profit_threshold(self) -> float:
+        return self._min_profit_threshold
+
+    @min_profit_threshold.setter
+    def min_profit_threshold(self, value: float) -> None:
+        self._min_profit_threshold = value
+        self._update_costs()
+
+    @property
+    def transaction_fee(self) -> float:
+        return self._transaction_fee
+
+    @transaction_fee.setter
+    def transaction_fee(self, value: float) -> None:
+        self._transaction_fee = value
+        self._update_costs()
+
+    def _update_costs(self) -> None:
+        """Recompute the per-position constants the checkers compare against"""
+        self._txn_cost = self._capital * self._transaction_fee * 2  # one trade per leg
+        self._min_profit_abs = self._min_profit_threshold * self._capital
+
+    def _build_opp(self, markets: List[Market], edge: float, risk_level: str,
+                   action_steps: List[Dict[str, any]]) -> Optional[ArbitrageOpportunity]:
+        """Build an opportunity from a price edge if it clears fees and the profit threshold"""
+        potential_profit = round(edge * self._capital - self._txn_cost, 6)
+
+        if potential_profit <= self._min_profit_abs:
+            return None
+
+        return ArbitrageOpportunity(
+            markets=markets,
+            profit_potential=_to_report(potential_profit),
+            risk_level=risk_level,
+            required_capital=_to_report(self._capital),
+            action_steps=action_steps,
+            transaction_costs=_to_report(self._txn_cost),
+            net_profit=_to_report(potential_profit)
+        )
 
     def check_complementary_markets(self, market1: Market, market2: Market) -> Optional[ArbitrageOpportunity]:
         """Check for arbitrage in complementary markets (sum should be 1)"""
         try:
             # Get best prices
-            market1_yes = Decimal(str(market1.prices['YES']))
-            market1_no = Decimal(str(market1.prices['NO']))
-            market2_yes = Decimal(str(market2.prices['YES']))
-            market2_no = Decimal(str(market2.prices['NO']))
-
-            # Check if sum of YES prices < 1
-            if market1_yes + market2_yes < Decimal('1'):
-                capital_required = (Decimal('1') * 100)  # $100 position size
-                transaction_costs = capital_required * self.transaction_fee * Decimal('2')
-                potential_profit = ((Decimal('1') - (market1_yes + market2_yes)) * capital_required) - transaction_costs
-
-                if potential_profit > self.min_profit_threshold * capital_required:
-                    return ArbitrageOpportunity(
-                        markets=[market1, market2],
-                        profit_potential=potential_profit,
-                        risk_level='LOW',
-                        required_capital=capital_required,
-                        action_steps=[
-                            {'market': market1.question, 'action': 'BUY', 'side': 'YES', 'price': market1_yes},
-                            {'market': market2.question, 'action': 'BUY', 'side': 'YES', 'price': market2_yes}
-                        ],
-                        transaction_costs=transaction_costs,
-                        net_profit=potential_profit
-                    )
-
-            # Check if sum of NO prices < 1
-            if market1_no + market2_no < Decimal('1'):
-                capital_required = (Decimal('1') * 100)
-                transaction_costs = capital_required * self.transaction_fee * Decimal('2')
-                potential_profit = ((Decimal('1') - (market1_no + market2_no)) * capital_required) - transaction_costs
-
-                if potential_profit > self.min_profit_threshold * capital_required:
-                    return ArbitrageOpportunity(
-                        markets=[market1, market2],
-                        profit_potential=potential_profit,
-                        risk_level='LOW',
-                        required_capital=capital_required,
-                        action_steps=[
-                            {'market': market1.question, 'action': 'BUY', 'side': 'NO', 'price': market1_no},
-                            {'market': market2.question, 'action': 'BUY', 'side': 'NO', 'price': market2_no}
-                        ],
-                        transaction_costs=transaction_costs,
-                        net_profit=potential_profit
-                    )
+            market1_yes = float(market1.prices['YES'])
+            market1_no = float(market1.prices['NO'])
+            market2_yes = float(market2.prices['YES'])
+            market2_no = float(market2.prices['NO'])
+
+            # Check if sum of YES prices < 1, then if sum of NO prices < 1
+            return self._build_opp(
+                [market1, market2], 1 - (market1_yes + market2_yes), 'LOW',
+                [
+                    {'market': market1.question, 'action': 'BUY', 'side': 'YES', 'price': market1_yes},
+                    {'market': market2.question, 'action': 'BUY', 'side': 'YES', 'price': market2_yes}
+                ]
+            ) or self._build_opp(
+                [market1, market2], 1 - (market1_no + market2_no), 'LOW',
+                [
+                    {'market': market1.question, 'action': 'BUY', 'side': 'NO', 'price': market1_no},
+                    {'market': market2.question, 'action': 'BUY', 'side': 'NO', 'price': market2_no}
+                ]
+            )
 
         except Exception as e:
             logger.error(f"Error checking complementary markets: {str(e)}")
@@ -77,28 +115,17 @@ class ArbitrageDetector:
     def check_nested_markets(self, subset_market: Market, superset_market: Market) -> Optional[ArbitrageOpportunity]:
         """Check for arbitrage in nested markets (subset should have lower probability)"""
         try:
-            subset_yes = Decimal(str(subset_market.prices['YES']))
-            superset_yes = Decimal(str(superset_market.prices['YES']))
+            subset_yes = float(subset_market.prices['YES'])
+            superset_yes = float(superset_market.prices['YES'])
 
             # If subset price > superset price, potential arbitrage
-            if subset_yes > superset_yes:
-                capital_required = (Decimal('1') * 100)
-                transaction_costs = capital_required * self.transaction_fee * Decimal('2')
-                potential_profit = ((subset_yes - superset_yes) * capital_required) - transaction_costs
-
-                if potential_profit > self.min_profit_threshold * capital_required:
-                    return ArbitrageOpportunity(
-                        markets=[subset_market, superset_market],
-                        profit_potential=potential_profit,
-                        risk_level='MEDIUM',
-                        required_capital=capital_required,
-                        action_steps=[
-                            {'market': subset_market.question, 'action': 'SELL', 'side': 'YES', 'price': subset_yes},
-                            {'market': superset_market.question, 'action': 'BUY', 'side': 'YES', 'price': superset_yes}
-                        ],
-                        transaction_costs=transaction_costs,
-                        net_profit=potential_profit
-                    )
+            return self._build_opp(
+                [subset_market, superset_market], subset_yes - superset_yes, 'MEDIUM',
+                [
+                    {'market': subset_market.question, 'action': 'SELL', 'side': 'YES', 'price': subset_yes},
+                    {'market': superset_market.question, 'action': 'BUY', 'side': 'YES', 'price': superset_yes}
+                ]
+            )
 
         except Exception as e:
             logger.error(f"Error checking nested markets: {str(e)}")
@@ -108,28 +135,17 @@ class ArbitrageDetector:
     def check_temporal_markets(self, earlier_market: Market, later_market: Market) -> Optional[ArbitrageOpportunity]:
         """Check for arbitrage in markets with temporal relationships"""
         try:
-            earlier_yes = Decimal(str(earlier_market.prices['YES']))
-            later_yes = Decimal(str(later_market.prices['YES']))
+            earlier_yes = float(earlier_market.prices['YES'])
+            later_yes = float(later_market.prices['YES'])
 
             # Earlier event should have lower or equal probability
-            if earlier_yes > later_yes:
-                capital_required = (Decimal('1') * 100)
-                transaction_costs = capital_required * self.transaction_fee * Decimal('2')
-                potential_profit = ((earlier_yes - later_yes) * capital_required) - transaction_costs
-
-                if potential_profit > self.min_profit_threshold * capital_required:
-                    return ArbitrageOpportunity(
-                        markets=[earlier_market, later_market],
-                        profit_potential=potential_profit,
-                        risk_level='MEDIUM',
-                        required_capital=capital_required,
-                        action_steps=[
-                            {'market': earlier_market.question, 'action': 'SELL', 'side': 'YES', 'price': earlier_yes},
-                            {'market': later_market.question, 'action': 'BUY', 'side': 'YES', 'price': later_yes}
-                        ],
-                        transaction_costs=transaction_costs,
-                        net_profit=potential_profit
-                    )
+            return self._build_opp(
+                [earlier_market, later_market], earlier_yes - later_yes, 'MEDIUM',
+                [
+                    {'market': earlier_market.question, 'action': 'SELL', 'side': 'YES', 'price': earlier_yes},
+                    {'market': later_market.question, 'action': 'BUY', 'side': 'YES', 'price': later_yes}
+                ]
+            )
 
         except Exception as e:
             logger.error(f"Error checking temporal markets: {str(e)}")
@@ -139,25 +155,55 @@ class ArbitrageDetector:
     def find_arbitrage_opportunities(self, markets: List[Market]) -> List[ArbitrageOpportunity]:
         """Find all arbitrage opportunities in the given markets"""
         opportunities = []
-
-        for i, market1 in enumerate(markets):
-            for market2 in markets[i+1:]:
+        yes, no = self._to_soa(markets)
+        # A check only pays out when its price edge beats the threshold plus fees on both legs
+        min_edge = (self._min_profit_abs + self._txn_cost) / self._capital - _SCREEN_EPS
+
+        # Screen pairs (i < j) a block of rows at a time, per check, so each classifier
+        # only sees pairs it could pay out on
+        for i0 in range(0, len(markets), _SCREEN_BLOCK_ROWS):
+            i1 = min(i0 + _SCREEN_BLOCK_ROWS, len(markets))
+            # Columns start at i0 + 1, so row r (market i0 + r) pairs with column c (market i0 + 1 + c)
+            # and the j > i half is the upper triangle including the diagonal
+            yes_rows, no_rows = yes[i0:i1, None], no[i0:i1, None]
+            yes_cols, no_cols = yes[None, i0 + 1:], no[None, i0 + 1:]
+            complementary = np.triu(
+                (1 - (yes_rows + yes_cols) > min_edge) | (1 - (no_rows + no_cols) > min_edge)
+            )
+            # Nested and temporal checks share the same edge: the first market's YES above the second's
+            ordered = np.triu(yes_rows - yes_cols > min_edge)
+
+            for r, c in zip(*(idx.tolist() for idx in np.nonzero(complementary | ordered))):
+                market1, market2 = markets[i0 + r], markets[i0 + 1 + c]
                 # Check various types of relationships
-                if self._are_complementary(market1, market2):
+                if complementary[r, c] and self._are_complementary(market1, market2):
                     if opp := self.check_complementary_markets(market1, market2):
                         opportunities.append(opp)
                 
-                if self._is_nested(market1, market2):
-                    if opp := self.check_nested_markets(market1, market2):
-                        opportunities.append(opp)
-                
-                if self._are_temporal(market1, market2):
-                    if opp := self.check_temporal_markets(market1, market2):
-                        opportunities.append(opp)
+                if ordered[r, c]:
+                    if self._is_nested(market1, market2):
+                        if opp := self.check_nested_markets(market1, market2):
+                            opportunities.append(opp)
+                    
+                    if self._are_temporal(market1, market2):
+                        if opp := self.check_temporal_markets(market1, market2):
+                            opportunities.append(opp)
 
         # Sort by profit potential
         return sorted(opportunities, key=lambda x: x.profit_potential, reverse=True)
 
+    @staticmethod
+    def _to_soa(markets: List[Market]) -> Tuple[np.ndarray, np.ndarray]:
+        """Parse YES/NO prices once per market into parallel arrays (NaN when unavailable)"""
+        yes, no = [], []
+        for market in markets:
+            for side, prices in (('YES', yes), ('NO', no)):
+                try:
+                    prices.append(float(market.prices[side]))
+                except (KeyError, TypeError, ValueError):
+                    prices.append(float('nan'))
+        return np.array(yes, dtype=np.float64), np.array(no, dtype=np.float64)
+
     def _are_complementary(self, market1: Market, market2: Market) -> bool:
         """Check if markets are logically complementary"""
         # Implementation needed: Use NLP or rules to determine if markets are complementary
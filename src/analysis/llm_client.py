@@ -1,6 +1,7 @@
-from openai import OpenAI
-import json
-from typing import Any, Dict, List
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from pydantic import TypeAdapter
+from typing import List
+from src.analysis.models import ArbitrageRelationship
 from src.config.settings import (
     OPENROUTER_API_KEY, 
     OPENROUTER_BASE_URL,
@@ -11,23 +12,28 @@ from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Built once: decodes and validates the structured response straight from JSON
+_RELATIONSHIPS_ADAPTER = TypeAdapter(List[ArbitrageRelationship])
+
 class LLMClient:
     def __init__(self):
-        self.client = OpenAI(
+        self.client = AsyncOpenAI(
             api_key=OPENROUTER_API_KEY,
-            base_url=OPENROUTER_BASE_URL
+            base_url=OPENROUTER_BASE_URL,
+            # HTTP/2 multiplexes concurrent analyze() calls over one kept-alive connection
+            http_client=DefaultAsyncHttpxClient(http2=True)
         )
         self.default_model = DEFAULT_MODEL
 
     async def analyze(self, 
                      prompt: str, 
                      model: str = None,
-                     temperature: float = DEFAULT_TEMPERATURE) -> List[Dict[str, Any]]:
+                     temperature: float = DEFAULT_TEMPERATURE) -> List[ArbitrageRelationship]:
         """
         Send analysis request to OpenRouter API with structured output.
         """
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=model or self.default_model,
                 messages=[{
                     "role": "system",
@@ -100,10 +106,11 @@ class LLMClient:
                     "X-Title": "Local Testing"
                 }
             )
-            logger.debug(f"Raw LLM response: {response.choices[0].message.content}") 
+            content = response.choices[0].message.content
+            logger.debug("Raw LLM response: %s", content)
             
             # The response will already be proper JSON
-            return json.loads(response.choices[0].message.content)
+            return _RELATIONSHIPS_ADAPTER.validate_json(content)
 
         except Exception as e:
             logger.error(f"LLM analysis failed: {str(e)}")
@@ -1,14 +1,19 @@
-from typing import List, Dict, Any
-import json
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import TYPE_CHECKING, List, Optional
 from datetime import datetime
 from pathlib import Path
 
 from src.analysis.llm_client import LLMClient
 from src.analysis.models import AnalysisResult
-from src.data.models import Market
-from src.config.settings import ANALYSIS_DIR
+from src.config.settings import LLM_MAX_CONCURRENCY, analysis_dir
 from src.utils.logger import setup_logger
 
+if TYPE_CHECKING:
+    from src.data.models import Market
+
 logger = setup_logger(__name__)
 
 class MarketAnalyzer:
@@ -16,7 +21,7 @@ class MarketAnalyzer:
         self.llm_client = LLMClient()
 
     def _build_relationship_prompt(self, markets: List[Market]) -> str:
-        """Build prompt for analyzing relationships between ALL markets."""
+        """Build prompt for analyzing relationships between all of the given markets."""
         markets_text = "\n\n".join([
             f"Market {i+1}:\nQuestion: {m.question}\nDescription: {m.description}\n"
             f"Current Prices: {m.prices}\nEnd Date: {m.end_date}"
@@ -48,25 +53,40 @@ class MarketAnalyzer:
 
     async def analyze_markets(self, 
                             markets: List[Market],
-                            save_output: bool = True) -> AnalysisResult:
+                            save_output: bool = True,
+                            chunk_size: Optional[int] = None) -> AnalysisResult:
         """
         Analyze all markets for arbitrage opportunities in a single pass.
+
+        With `chunk_size` set, the markets are instead split into chunks that are
+        prompted concurrently (at most LLM_MAX_CONCURRENCY at a time). This trades
+        away relationships between markets in different chunks for smaller prompts.
         """
         try:
             logger.info(f"Starting analysis of {len(markets)} markets")
             
-            relationships = await self.llm_client.analyze(
-                self._build_relationship_prompt(markets)
-            )
+            if not chunk_size:
+                chunks = [markets]
+            else:
+                chunks = [markets[i:i + chunk_size] for i in range(0, len(markets), chunk_size)]
+            semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+
+            async def analyze_chunk(chunk: List[Market]):
+                async with semaphore:
+                    return await self.llm_client.analyze(self._build_relationship_prompt(chunk))
+
+            responses = await asyncio.gather(*(analyze_chunk(chunk) for chunk in chunks))
+            relationships = [r for response in responses for r in response]
 
-            results = AnalysisResult(
+            # Relationships were already validated when LLMClient decoded them
+            results = AnalysisResult.model_construct(
                 timestamp=datetime.now().isoformat(),
                 total_markets=len(markets),
                 relationships=relationships
             )
 
             if save_output:
-                self._save_analysis(results.dict())
+                self._save_analysis(results)
                 logger.info(f"Analysis saved with {len(results.relationships)} relationships found")
 
             return results
@@ -75,14 +95,14 @@ class MarketAnalyzer:
             logger.error(f"Market analysis failed: {str(e)}")
             raise
 
-    def _save_analysis(self, results: Dict[str, Any]) -> None:
+    def _save_analysis(self, results: AnalysisResult) -> None:
         """Save analysis results to file."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = ANALYSIS_DIR / f"arbitrage_analysis_{timestamp}.json"
         
         try:
+            filename = os.path.join(analysis_dir(), f"arbitrage_analysis_{timestamp}.json")
             with open(filename, "w", encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+                f.write(results.model_dump_json(indent=2))
             logger.info(f"Analysis saved to {filename}")
         except Exception as e:
             logger.error(f"Failed to save analysis: {str(e)}")
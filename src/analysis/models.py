@@ -1,14 +1,10 @@
-from typing import List, Optional
+from typing import List, Literal, Optional
+from typing_extensions import TypedDict  # pydantic requires it over typing.TypedDict before 3.12
 from pydantic import BaseModel
-from enum import Enum
 
-class RelationType(str, Enum):
-    MUTUALLY_EXCLUSIVE = "mutually_exclusive"
-    COMPLEMENTARY = "complementary"
-    CONDITIONAL = "conditional"
-    UNRELATED = "unrelated"
+RelationType = Literal["mutually_exclusive", "complementary", "conditional", "unrelated"]
 
-class ArbitrageRelationship(BaseModel):
+class ArbitrageRelationship(TypedDict):
     markets: List[str]
     relationship_type: RelationType
     confidence_score: float
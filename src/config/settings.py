@@ -1,4 +1,5 @@
 from typing import Dict, Any
+from functools import lru_cache
 from pathlib import Path
 import os
 
@@ -9,7 +10,6 @@ DEFAULT_REQUEST_TIMEOUT = 30
 # Storage Settings
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 DATA_DIR = PROJECT_ROOT / "data" / "markets"
-DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 # Logging Settings
 LOG_LEVEL = "INFO"
@@ -20,7 +20,14 @@ OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 DEFAULT_MODEL = "anthropic/claude-3.7-sonnet"
 DEFAULT_TEMPERATURE = 0.1
+LLM_MAX_CONCURRENCY = 4  # in-flight LLM requests when analysis is chunked
 
 # Analysis Output Directory
-ANALYSIS_DIR = Path(__file__).parent.parent.parent / "data" / "analysis"
-ANALYSIS_DIR.mkdir(parents=True, exist_ok=True)
\ No newline at end of file
+ANALYSIS_DIR = PROJECT_ROOT / "data" / "analysis"
+ANALYSIS_DIR_STR = str(ANALYSIS_DIR)
+
+# Output directory is created on first use rather than at import time
+@lru_cache(maxsize=None)
+def analysis_dir() -> str:
+    os.makedirs(ANALYSIS_DIR_STR, exist_ok=True)
+    return ANALYSIS_DIR_STR
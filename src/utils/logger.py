@@ -1,15 +1,93 @@
+import atexit
 import logging
+import operator
+import queue
+import re
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
 from src.config.settings import LOG_LEVEL, LOG_FORMAT
 
+_LOGGER_CACHE: Dict[str, logging.Logger] = {}
+_QUEUE_HANDLER: Optional[QueueHandler] = None
+_FIELD = re.compile(r"%\((\w+)\)s")
+
+class CompiledFormatter(logging.Formatter):
+    """Formatter that fills a plain %(field)s format without PercentStyle's mapping lookups."""
+
+    def __init__(self, fmt: str = None, datefmt: str = None):
+        super().__init__(fmt, datefmt)
+        # Compile a format made only of %(field)s placeholders into a positional template and
+        # a single attribute getter, skipping PercentStyle's per-record mapping lookups
+        fields = _FIELD.findall(self._fmt)
+        template = _FIELD.sub("%s", self._fmt)
+        if fields and "%(" not in template:
+            getter = operator.attrgetter(*fields)
+            self._compiled = (template, getter if len(fields) > 1 else lambda record: (getter(record),))
+        else:
+            self._compiled = None
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        if self._compiled is None:
+            return super().formatMessage(record)
+        template, getter = self._compiled
+        return template % getter(record)
+
+# One formatter for the console handler; LOG_FORMAT is compiled once here
+_FORMATTER = CompiledFormatter(LOG_FORMAT)
+
+def _get_queue_handler() -> QueueHandler:
+    """Return the shared queue handler, starting the background console writer on first use."""
+    global _QUEUE_HANDLER
+    if _QUEUE_HANDLER is None:
+        log_queue = queue.SimpleQueue()
+        handler = logging.StreamHandler()
+        handler.setFormatter(_FORMATTER)
+        listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        listener.start()
+        # Drain queued records before the interpreter exits
+        atexit.register(listener.stop)
+        _QUEUE_HANDLER = QueueHandler(log_queue)
+    return _QUEUE_HANDLER
+
+def _skip_caller_lookup(logger: logging.Logger) -> None:
+    """Stop `logger` walking the stack for caller info, which LOG_FORMAT never prints.
+
+    Records from this logger report "(unknown file)", 0, "(unknown function)" as their
+    caller unless `stack_info=True` is passed, in which case the stdlib lookup runs as usual.
+    """
+    find_caller = logger.findCaller
+
+    def find_caller_for_stack_only(stack_info: bool = False, stacklevel: int = 1):
+        if stack_info:
+            # One extra level skips this wrapper's own frame
+            return find_caller(stack_info, stacklevel + 1)
+        return "(unknown file)", 0, "(unknown function)", None
+
+    logger.findCaller = find_caller_for_stack_only
+
 def setup_logger(name: str) -> logging.Logger:
-    """Configure and return a logger instance."""
+    """Configure and return a logger instance.
+
+    Call sites whose log arguments are expensive to build should guard them with
+    `if logger.isEnabledFor(level):` so the work is skipped when the level is off.
+    """
+    # Logger names key both our cache and logging's manager; interned strings compare by identity
+    name = sys.intern(name)
+    cached = _LOGGER_CACHE.get(name)
+    if cached is not None:
+        return cached
+
     logger = logging.getLogger(name)
     
     if not logger.handlers:
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(LOG_FORMAT)
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        # QueueHandler.prepare renders the message (and any traceback) on the caller's thread so later
+        # changes to the args can't alter it; LOG_FORMAT and the stream write run on the listener thread
+        logger.addHandler(_get_queue_handler())
         logger.setLevel(LOG_LEVEL)
+        # Records are fully handled here; don't walk up to ancestor handlers
+        logger.propagate = False
+        _skip_caller_lookup(logger)
     
+    _LOGGER_CACHE[name] = logger
     return logger
@@ -0,0 +1,122 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+import src.analysis.arbitrage_detector as arbitrage_detector
+from src.analysis.arbitrage_detector import ArbitrageDetector
+
+
+class AllPairsDetector(ArbitrageDetector):
+    """Detector whose relationship classifiers accept every pair, so only prices decide."""
+
+    def _are_complementary(self, market1, market2):
+        return True
+
+    def _is_nested(self, market1, market2):
+        return True
+
+    def _are_temporal(self, market1, market2):
+        return True
+
+
+def _market(question, yes, no):
+    prices = {}
+    if yes is not None:
+        prices['YES'] = yes
+    if no is not None:
+        prices['NO'] = no
+    return SimpleNamespace(question=question, prices=prices)
+
+
+def _random_markets(count, seed):
+    rng = random.Random(seed)
+    markets = [
+        _market(f"q{i}", str(round(rng.random(), 2)), str(round(rng.random(), 2)))
+        for i in range(count)
+    ]
+    # Missing and unparsable prices
+    markets += [
+        _market("no NO price", "0.10", None),
+        _market("no YES price", None, "0.10"),
+        _market("bad YES price", "n/a", "0.30"),
+        _market("null prices", None, None),
+    ]
+    # Pairs sitting exactly on the 0.06 edge threshold
+    markets += [
+        _market("edge sum a", "0.47", "0.90"),
+        _market("edge sum b", "0.47", "0.90"),
+        _market("edge diff a", "0.53", "0.90"),
+        _market("edge diff b", "0.47", "0.90"),
+    ]
+    rng.shuffle(markets)
+    return markets
+
+
+def _unscreened(detector, markets):
+    opportunities = []
+    for i, market1 in enumerate(markets):
+        for market2 in markets[i + 1:]:
+            for check in (detector.check_complementary_markets,
+                          detector.check_nested_markets,
+                          detector.check_temporal_markets):
+                if opp := check(market1, market2):
+                    opportunities.append(opp)
+    return sorted(opportunities, key=lambda x: x.profit_potential, reverse=True)
+
+
+def _key(opp):
+    return (
+        tuple(m.question for m in opp.markets),
+        opp.risk_level,
+        tuple((s['action'], s['side']) for s in opp.action_steps),
+        opp.net_profit,
+    )
+
+
+@pytest.mark.parametrize("block_rows", [1, 7, 256])
+def test_screened_scan_matches_unscreened_checkers(monkeypatch, block_rows):
+    monkeypatch.setattr(arbitrage_detector, "_SCREEN_BLOCK_ROWS", block_rows)
+    detector = AllPairsDetector()
+    markets = _random_markets(120, seed=block_rows)
+
+    screened = detector.find_arbitrage_opportunities(markets)
+
+    assert [_key(o) for o in screened] == [_key(o) for o in _unscreened(detector, markets)]
+
+
+@pytest.mark.parametrize("attribute, value", [("min_profit_threshold", 0.08), ("min_profit_threshold", 0.0),
+                                              ("transaction_fee", 0.05), ("transaction_fee", 0.0)])
+def test_screen_follows_settings_changed_after_construction(attribute, value):
+    detector = AllPairsDetector()
+    setattr(detector, attribute, value)
+    markets = _random_markets(60, seed=3)
+
+    screened = detector.find_arbitrage_opportunities(markets)
+
+    assert [_key(o) for o in screened] == [_key(o) for o in _unscreened(detector, markets)]
+
+
+def test_raised_threshold_rejects_previous_opportunity():
+    detector = AllPairsDetector()
+    markets = [_market("a", "0.40", "0.90"), _market("b", "0.50", "0.90")]
+    assert len(detector.find_arbitrage_opportunities(markets)) == 1
+
+    detector.min_profit_threshold = 0.08
+    assert detector.find_arbitrage_opportunities(markets) == []
+    assert detector.check_complementary_markets(*markets) is None
+
+
+def test_pairs_exactly_at_threshold_are_rejected():
+    detector = AllPairsDetector()
+    markets = [_market("a", "0.47", "0.90"), _market("b", "0.47", "0.90")]
+    assert detector.find_arbitrage_opportunities(markets) == []
+
+    markets = [_market("a", "0.53", "0.90"), _market("b", "0.47", "0.90")]
+    assert detector.find_arbitrage_opportunities(markets) == []
+
+
+def test_empty_and_single_market():
+    detector = AllPairsDetector()
+    assert detector.find_arbitrage_opportunities([]) == []
+    assert detector.find_arbitrage_opportunities([_market("a", "0.10", "0.10")]) == []
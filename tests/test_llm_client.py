@@ -0,0 +1,55 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from src.analysis.llm_client import _RELATIONSHIPS_ADAPTER
+from src.analysis.models import AnalysisResult
+
+SAMPLE_PAYLOAD = json.dumps([
+    {
+        "markets": ["Will X win the election?", "Will Y win the election?"],
+        "relationship_type": "mutually_exclusive",
+        "confidence_score": 0.95,
+        "explanation": "Only one candidate can win",
+        "potential_arbitrage": True,
+        "combined_probability": 0.93,
+        "arbitrage_explanation": "Buying NO on both costs less than the guaranteed payout",
+    },
+    {
+        "markets": ["Will it rain tomorrow?", "Will BTC close above $100k?"],
+        "relationship_type": "unrelated",
+        "confidence_score": 0.99,
+        "explanation": "No causal link",
+        "potential_arbitrage": False,
+        "combined_probability": None,
+        "arbitrage_explanation": "",
+    },
+])
+
+
+def test_payload_round_trips_through_analysis_result():
+    relationships = _RELATIONSHIPS_ADAPTER.validate_json(SAMPLE_PAYLOAD)
+    assert relationships == json.loads(SAMPLE_PAYLOAD)
+
+    result = AnalysisResult.model_construct(
+        timestamp="2024-01-01T00:00:00",
+        total_markets=4,
+        relationships=relationships
+    )
+    dumped = json.loads(result.model_dump_json(indent=2))
+
+    assert dumped == {
+        "timestamp": "2024-01-01T00:00:00",
+        "total_markets": 4,
+        "relationships": json.loads(SAMPLE_PAYLOAD),
+    }
+    assert AnalysisResult.model_validate_json(result.model_dump_json()) == result
+
+
+def test_payload_with_unknown_relationship_type_is_rejected():
+    payload = json.loads(SAMPLE_PAYLOAD)
+    payload[0]["relationship_type"] = "correlated"
+
+    with pytest.raises(ValidationError):
+        _RELATIONSHIPS_ADAPTER.validate_json(json.dumps(payload))
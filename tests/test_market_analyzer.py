@@ -0,0 +1,72 @@
+import asyncio
+import re
+from types import SimpleNamespace
+
+import pytest
+
+import src.analysis.market_analyzer as market_analyzer
+from src.analysis.market_analyzer import MarketAnalyzer
+from src.config.settings import LLM_MAX_CONCURRENCY
+
+
+class StubLLMClient:
+    """Answers each prompt with one relationship naming the prompt's markets, tracking concurrency."""
+
+    def __init__(self):
+        self.prompts = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def analyze(self, prompt):
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            # Yield so every chunk the semaphore admits is in flight together
+            await asyncio.sleep(0.01)
+            return [{
+                "markets": re.findall(r"Question: (\S+)", prompt),
+                "relationship_type": "unrelated",
+                "confidence_score": 0.5,
+                "explanation": "stub",
+                "potential_arbitrage": False,
+                "combined_probability": None,
+                "arbitrage_explanation": "",
+            }]
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    monkeypatch.setattr(market_analyzer, "LLMClient", StubLLMClient)
+    return MarketAnalyzer()
+
+
+def _markets(count):
+    return [
+        SimpleNamespace(question=f"q{i}", description="", prices={'YES': '0.5', 'NO': '0.5'}, end_date=None)
+        for i in range(count)
+    ]
+
+
+def test_chunked_analysis_merges_every_chunk(analyzer):
+    markets = _markets(23)
+
+    result = asyncio.run(analyzer.analyze_markets(markets, save_output=False, chunk_size=2))
+
+    assert len(analyzer.llm_client.prompts) == 12
+    assert result.total_markets == 23
+    assert [r["markets"] for r in result.relationships] == [
+        [f"q{i}" for i in range(start, min(start + 2, 23))] for start in range(0, 23, 2)
+    ]
+    assert 1 < analyzer.llm_client.peak_in_flight <= LLM_MAX_CONCURRENCY
+
+
+def test_unchunked_analysis_sends_a_single_prompt(analyzer):
+    markets = _markets(5)
+
+    result = asyncio.run(analyzer.analyze_markets(markets, save_output=False))
+
+    assert len(analyzer.llm_client.prompts) == 1
+    assert [r["markets"] for r in result.relationships] == [["q0", "q1", "q2", "q3", "q4"]]